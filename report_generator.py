@@ -6,33 +6,51 @@ Automated Report Generation Script
 This script reads data from a CSV file, analyzes it, and generates a formatted PDF report.
 """
 
-import csv
+import importlib.util
+import io
 import os
-import sys
 from datetime import datetime
-import matplotlib.pyplot as plt
+from itertools import accumulate
 import numpy as np
+import pandas as pd
 
 try:
     from fpdf import FPDF
+except ImportError as e:
+    raise ImportError("fpdf2 is required to build the PDF report; install it with 'pip install -r requirements.txt'") from e
+
+try:
+    from numba import njit
 except ImportError:
-    print("FPDF library not found. Installing...")
-    try:
-        import subprocess
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "fpdf"])
-        from fpdf import FPDF
-        print("FPDF installed successfully.")
-    except Exception as e:
-        print(f"Failed to install FPDF: {e}")
-        sys.exit(1)
+    njit = None
 
-def create_sample_data(filename):
-    """Create sample CSV data if file doesn't exist"""
-    if os.path.exists(filename):
-        print(f"Data file '{filename}' already exists.")
-        return
-    
-    sample_data = """Date,Product,Region,Sales,Expenses
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# pyarrow's multithreaded CSV parser is used for ingestion when it is installed;
+# _read_csv falls back to pandas' C parser if it turns out not to be importable
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+
+# Group keys are dictionary-encoded while parsing, so each string is hashed only once.
+# Keys and dates are always read as text so codes such as '001' and '1' stay distinct.
+CSV_DTYPES = {
+    'Date': 'str',
+    'Product': 'category',
+    'Region': 'category',
+    'Sales': 'float64',
+    'Expenses': 'float64'
+}
+
+# Columns every row must fill in; blank cells are rejected rather than read as NaN
+REQUIRED_COLUMNS = ['Date', 'Product', 'Region', 'Sales', 'Expenses']
+
+# Upper bound for the CSV read buffer; small files keep the default buffer size
+READ_BUFFER_SIZE = 1 << 20
+
+# Sample data used when no input file exists yet
+SAMPLE_DATA = b"""Date,Product,Region,Sales,Expenses
 2023-01-01,Product A,North,5000,3000
 2023-01-01,Product B,North,4500,2800
 2023-01-01,Product C,North,6000,3500
@@ -51,92 +69,144 @@ def create_sample_data(filename):
 2023-03-01,Product A,South,5700,3350
 2023-03-01,Product B,South,5000,3000
 2023-03-01,Product C,South,6400,3950"""
+
+def create_sample_data(filename):
+    """Create sample CSV data if file doesn't exist"""
+    # O_EXCL makes the existence check and the creation a single atomic step
+    try:
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        print(f"Data file '{filename}' already exists.")
+        return
     
-    with open(filename, 'w') as f:
-        f.write(sample_data)
+    try:
+        os.write(fd, SAMPLE_DATA)
+    finally:
+        os.close(fd)
     
     print(f"Sample data file '{filename}' created successfully.")
 
+def _read_csv(file):
+    """Parse the raw CSV with the configured engine, keeping key columns as text"""
+    if CSV_ENGINE == 'pyarrow':
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            # pyarrow is installed but cannot be imported; use pandas' C parser instead
+            pa_csv = None
+        
+        if pa_csv is not None:
+            # pandas' pyarrow engine infers types before applying dtype, which turns
+            # numeric-looking keys into numbers, so pyarrow is given the types directly
+            arrow_types = {
+                'str': pa.string(),
+                'category': pa.dictionary(pa.int32(), pa.string()),
+                'float64': pa.float64()
+            }
+            column_types = {column: arrow_types[dtype] for column, dtype in CSV_DTYPES.items()}
+            options = pa_csv.ConvertOptions(column_types=column_types, null_values=[''],
+                                            strings_can_be_null=True)
+            return pa_csv.read_csv(file, convert_options=options).to_pandas()
+    
+    # Only truly empty cells count as missing; values such as 'NA' or 'None' are kept
+    return pd.read_csv(file, dtype=CSV_DTYPES,
+                       keep_default_na=False, na_values=[''])
+
 def read_and_analyze_data(filename):
     """Read data from CSV file and perform basic analysis"""
-    data = []
     try:
-        with open(filename, 'r') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                data.append(row)
+        buffer_size = max(min(os.path.getsize(filename), READ_BUFFER_SIZE), io.DEFAULT_BUFFER_SIZE)
+        with open(filename, 'rb', buffering=buffer_size) as file:
+            data = _read_csv(file)
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         return None
+    except ValueError as e:
+        print(f"Error processing data: {e}")
+        return None
     except Exception as e:
         print(f"Error reading file: {e}")
         return None
     
-    # Convert numeric fields to appropriate types
-    for row in data:
-        try:
-            row['Sales'] = float(row['Sales'])
-            row['Expenses'] = float(row['Expenses'])
-            row['Profit'] = row['Sales'] - row['Expenses']
-            row['Date'] = datetime.strptime(row['Date'], '%Y-%m-%d')
-        except (ValueError, KeyError) as e:
-            print(f"Error processing data: {e}")
-            return None
+    # Convert dates and derive profit column-wise instead of row by row
+    try:
+        missing = data[REQUIRED_COLUMNS].isna().any()
+        if missing.any():
+            raise ValueError(f"missing values in column(s): {', '.join(missing.index[missing])}")
+        data['Date'] = pd.to_datetime(data['Date'], format='%Y-%m-%d', cache=True)
+        sales = data['Sales'].to_numpy()
+        expenses = data['Expenses'].to_numpy()
+        if ne is not None:
+            data['Profit'] = ne.evaluate('sales - expenses')
+        else:
+            data['Profit'] = np.subtract(sales, expenses, out=np.empty_like(sales))
+    except (ValueError, KeyError) as e:
+        print(f"Error processing data: {e}")
+        return None
     
     return data
 
+def _group_sum(codes, values, n_groups):
+    """Sum values per integer group code"""
+    return np.bincount(codes, weights=values, minlength=n_groups)
+
+if njit is not None:
+    @njit(cache=True)
+    def _group_sum(codes, values, n_groups):
+        """Sum values per integer group code (compiled with Numba)"""
+        out = np.zeros(n_groups)
+        for i in range(codes.shape[0]):
+            out[codes[i]] += values[i]
+        return out
+
+def group_statistics(keys, sales, expenses, profit):
+    """Aggregate sales, expenses and profit per group as parallel arrays indexed by group id"""
+    # Categorical and integer keys factorize without hashing strings
+    codes, labels = pd.factorize(keys)
+    
+    # Rows with a missing key are left out, as groupby would do
+    valid = codes >= 0
+    if not valid.all():
+        codes, sales, expenses, profit = codes[valid], sales[valid], expenses[valid], profit[valid]
+    
+    n_groups = len(labels)
+    stats = {
+        'labels': np.asarray(labels),
+        'sales': _group_sum(codes, sales, n_groups),
+        'expenses': _group_sum(codes, expenses, n_groups),
+        'profit': _group_sum(codes, profit, n_groups),
+        'count': np.bincount(codes, minlength=n_groups)
+    }
+    stats['avg_sales'] = stats['sales'] / stats['count']
+    stats['avg_profit'] = stats['profit'] / stats['count']
+    stats['margin'] = np.divide(stats['profit'] * 100, stats['sales'],
+                                out=np.zeros(n_groups), where=stats['sales'] > 0)
+    return stats
+
 def perform_analysis(data):
     """Perform various analyses on the data"""
-    if not data:
+    if data is None or data.empty:
         return None
     
+    # The value columns are extracted once and shared by every aggregation
+    sales = data['Sales'].to_numpy()
+    expenses = data['Expenses'].to_numpy()
+    profit = data['Profit'].to_numpy()
+    
     # Overall statistics
-    total_sales = sum(row['Sales'] for row in data)
-    total_expenses = sum(row['Expenses'] for row in data)
+    total_sales = float(sales.sum())
+    total_expenses = float(expenses.sum())
     total_profit = total_sales - total_expenses
     profit_margin = (total_profit / total_sales) * 100 if total_sales > 0 else 0
     
-    # Group by product
-    products = {}
-    for row in data:
-        product = row['Product']
-        if product not in products:
-            products[product] = {'sales': 0, 'expenses': 0, 'profit': 0, 'count': 0}
-        products[product]['sales'] += row['Sales']
-        products[product]['expenses'] += row['Expenses']
-        products[product]['profit'] += row['Profit']
-        products[product]['count'] += 1
-    
-    # Group by region
-    regions = {}
-    for row in data:
-        region = row['Region']
-        if region not in regions:
-            regions[region] = {'sales': 0, 'expenses': 0, 'profit': 0, 'count': 0}
-        regions[region]['sales'] += row['Sales']
-        regions[region]['expenses'] += row['Expenses']
-        regions[region]['profit'] += row['Profit']
-        regions[region]['count'] += 1
-    
-    # Group by month
-    months = {}
-    for row in data:
-        month = row['Date'].strftime('%Y-%m')
-        if month not in months:
-            months[month] = {'sales': 0, 'expenses': 0, 'profit': 0, 'count': 0}
-        months[month]['sales'] += row['Sales']
-        months[month]['expenses'] += row['Expenses']
-        months[month]['profit'] += row['Profit']
-        months[month]['count'] += 1
-    
-    # Calculate averages
-    for product in products:
-        products[product]['avg_sales'] = products[product]['sales'] / products[product]['count']
-        products[product]['avg_profit'] = products[product]['profit'] / products[product]['count']
-    
-    for region in regions:
-        regions[region]['avg_sales'] = regions[region]['sales'] / regions[region]['count']
-        regions[region]['avg_profit'] = regions[region]['profit'] / regions[region]['count']
+    # Group by product, region and month
+    products = group_statistics(data['Product'], sales, expenses, profit)
+    regions = group_statistics(data['Region'], sales, expenses, profit)
+    # Months are keyed by an integer month index; labels are only built per group
+    month_keys = data['Date'].dt.year * 12 + data['Date'].dt.month - 1
+    months = group_statistics(month_keys, sales, expenses, profit)
+    months['labels'] = np.array([f"{int(key) // 12:04d}-{int(key) % 12 + 1:02d}" for key in months['labels']])
     
     analysis_results = {
         'overall': {
@@ -152,49 +222,67 @@ def perform_analysis(data):
     
     return analysis_results
 
+# matplotlib is only imported once charts are actually requested
+_plt = None
+
+def _pyplot():
+    """Import pyplot on first use with the non-interactive Agg backend"""
+    global _plt
+    if _plt is None:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
+
 def create_charts(analysis_results):
-    """Create visualizations for the report"""
+    """Create visualizations for the report as in-memory PNG buffers"""
+    plt = _pyplot()
     products = analysis_results['products']
     months = analysis_results['months']
     
     # Product performance chart
-    product_names = list(products.keys())
-    product_sales = [products[p]['sales'] for p in product_names]
-    product_profits = [products[p]['profit'] for p in product_names]
+    product_names = list(products['labels'])
+    product_sales = products['sales']
+    product_profits = products['profit']
     
     x = np.arange(len(product_names))
     width = 0.35
     
-    plt.figure(figsize=(10, 6))
-    plt.bar(x - width/2, product_sales, width, label='Sales')
-    plt.bar(x + width/2, product_profits, width, label='Profit')
-    plt.xlabel('Products')
-    plt.ylabel('Amount ($)')
-    plt.title('Sales and Profit by Product')
-    plt.xticks(x, product_names)
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig('product_performance.png')
-    plt.close()
+    # Both charts are drawn on the same figure, cleared in between
+    fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
+    ax.bar(x - width/2, product_sales, width, label='Sales')
+    ax.bar(x + width/2, product_profits, width, label='Profit')
+    ax.set_xlabel('Products')
+    ax.set_ylabel('Amount ($)')
+    ax.set_title('Sales and Profit by Product')
+    ax.set_xticks(x)
+    ax.set_xticklabels(product_names)
+    ax.legend()
+    product_chart = io.BytesIO()
+    fig.savefig(product_chart, format='png')
+    product_chart.seek(0)
+    ax.clear()
     
     # Monthly trend chart
-    month_names = list(months.keys())
-    monthly_sales = [months[m]['sales'] for m in month_names]
-    monthly_profits = [months[m]['profit'] for m in month_names]
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(month_names, monthly_sales, marker='o', label='Sales')
-    plt.plot(month_names, monthly_profits, marker='s', label='Profit')
-    plt.xlabel('Month')
-    plt.ylabel('Amount ($)')
-    plt.title('Monthly Sales and Profit Trend')
-    plt.legend()
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.tight_layout()
-    plt.savefig('monthly_trend.png')
-    plt.close()
+    month_names = list(months['labels'])
+    monthly_sales = months['sales']
+    monthly_profits = months['profit']
+    
+    ax.plot(month_names, monthly_sales, marker='o', label='Sales')
+    ax.plot(month_names, monthly_profits, marker='s', label='Profit')
+    ax.set_xlabel('Month')
+    ax.set_ylabel('Amount ($)')
+    ax.set_title('Monthly Sales and Profit Trend')
+    ax.legend()
+    ax.grid(True, linestyle='--', alpha=0.7)
+    monthly_chart = io.BytesIO()
+    fig.savefig(monthly_chart, format='png')
+    monthly_chart.seek(0)
+    plt.close(fig)
     
     print("Visualizations created successfully.")
+    return {'product': product_chart, 'monthly': monthly_chart}
 
 class PDFReport(FPDF):
     """Custom PDF report class"""
@@ -218,28 +306,66 @@ class PDFReport(FPDF):
         self.multi_cell(0, 10, body)
         self.ln()
     
-    def add_table(self, headers, data, col_widths=None):
+    def add_table(self, headers, data, col_widths=None, row_height=10):
         self.set_font('Arial', 'B', 12)
         
         if col_widths is None:
             col_width = self.w / (len(headers) + 1)
             col_widths = [col_width] * len(headers)
         
+        # Column edges are fixed for the whole table
+        edges = list(accumulate(col_widths, initial=self.x))
+        top = self.y
+        
         # Headers
-        for i, header in enumerate(headers):
-            self.cell(col_widths[i], 10, header, 1)
-        self.ln()
+        top = self._table_rows([headers], edges, top, row_height)
         
         # Data
         self.set_font('Arial', '', 12)
-        for row in data:
-            for i, item in enumerate(row):
-                self.cell(col_widths[i], 10, str(item), 1)
-            self.ln()
+        top = self._table_rows(data, edges, top, row_height)
+        self._table_grid(edges, top, self.y, row_height)
+    
+    def _table_rows(self, rows, edges, top, h):
+        """Write table text only; borders are drawn per page by _table_grid"""
+        for row in rows:
+            if self.y + h > self.page_break_trigger:
+                self._table_grid(edges, top, self.y, h)
+                self.add_page()
+                top = self.y
+            baseline = self.y + 0.5 * h + 0.3 * self.font_size
+            for x, item in zip(edges, row):
+                self.text(x + self.c_margin, baseline, str(item))
+            self.set_y(self.y + h)
+        return top
+    
+    def _table_grid(self, edges, top, bottom, h):
+        """Draw the cell borders of a table section spanning top to bottom"""
+        # Nothing was written on this page yet (e.g. the header row itself broke the page)
+        if bottom <= top:
+            return
+        for i in range(round((bottom - top) / h) + 1):
+            self.line(edges[0], top + i * h, edges[-1], top + i * h)
+        for x in edges:
+            self.line(x, top, x, bottom)
 
-def generate_report(analysis_results, filename='sales_report.pdf'):
-    """Generate PDF report with analysis results"""
-    pdf = PDFReport()
+def format_table(stats, label_header):
+    """Format grouped statistics into (headers, rows) for add_table, one whole column at a time"""
+    formatted = pd.DataFrame({
+        label_header: stats['labels'],
+        'Sales': pd.Series(stats['sales']).map('${:,.2f}'.format),
+        'Expenses': pd.Series(stats['expenses']).map('${:,.2f}'.format),
+        'Profit': pd.Series(stats['profit']).map('${:,.2f}'.format),
+        'Margin (%)': pd.Series(stats['margin']).map('{:.2f}%'.format)
+    })
+    return list(formatted.columns), formatted.to_numpy().tolist()
+
+def pick_group(stats, selector):
+    """Return (label, profit) of the group chosen by selector (np.argmax/np.argmin) over profit"""
+    index = int(selector(stats['profit']))
+    return stats['labels'][index], stats['profit'][index]
+
+def _render_summary(pdf, overall):
+    """Render the title block and executive summary on the first page"""
     pdf.add_page()
     
     # Title
@@ -254,7 +380,6 @@ def generate_report(analysis_results, filename='sales_report.pdf'):
     
     # Executive Summary
     pdf.chapter_title('Executive Summary')
-    overall = analysis_results['overall']
     summary = f"""
     This report provides an analysis of sales performance across different products and regions.
     
@@ -265,96 +390,31 @@ def generate_report(analysis_results, filename='sales_report.pdf'):
     - Profit Margin: {overall['profit_margin']:.2f}%
     """
     pdf.chapter_body(summary)
-    
-    # Product Performance
-    pdf.add_page()
-    pdf.chapter_title('Product Performance')
-    
-    # Add product performance chart
-    pdf.image('product_performance.png', x=10, y=None, w=180)
-    pdf.ln(100)
-    
-    # Product table
-    products = analysis_results['products']
-    product_table_headers = ['Product', 'Sales', 'Expenses', 'Profit', 'Margin (%)']
-    product_table_data = []
-    for product, stats in products.items():
-        margin = (stats['profit'] / stats['sales']) * 100 if stats['sales'] > 0 else 0
-        product_table_data.append([
-            product,
-            f"${stats['sales']:,.2f}",
-            f"${stats['expenses']:,.2f}",
-            f"${stats['profit']:,.2f}",
-            f"{margin:.2f}%"
-        ])
-    
-    pdf.chapter_title('Product Performance Details')
-    pdf.add_table(product_table_headers, product_table_data)
-    
-    # Regional Performance
-    pdf.add_page()
-    pdf.chapter_title('Regional Performance')
-    
-    regions = analysis_results['regions']
-    region_table_headers = ['Region', 'Sales', 'Expenses', 'Profit', 'Margin (%)']
-    region_table_data = []
-    for region, stats in regions.items():
-        margin = (stats['profit'] / stats['sales']) * 100 if stats['sales'] > 0 else 0
-        region_table_data.append([
-            region,
-            f"${stats['sales']:,.2f}",
-            f"${stats['expenses']:,.2f}",
-            f"${stats['profit']:,.2f}",
-            f"{margin:.2f}%"
-        ])
-    
-    pdf.add_table(region_table_headers, region_table_data)
-    
-    # Monthly Trend
+
+def _render_section(pdf, title, table, chart=None, details_title=None):
+    """Render one performance section: title, optional chart and its table"""
     pdf.add_page()
-    pdf.chapter_title('Monthly Trend Analysis')
+    pdf.chapter_title(title)
     
-    # Add monthly trend chart
-    pdf.image('monthly_trend.png', x=10, y=None, w=180)
-    pdf.ln(100)
+    if chart is not None:
+        pdf.image(chart, x=10, y=None, w=180)
+        pdf.ln(100)
     
-    months = analysis_results['months']
-    month_table_headers = ['Month', 'Sales', 'Expenses', 'Profit', 'Margin (%)']
-    month_table_data = []
-    for month, stats in months.items():
-        margin = (stats['profit'] / stats['sales']) * 100 if stats['sales'] > 0 else 0
-        month_table_data.append([
-            month,
-            f"${stats['sales']:,.2f}",
-            f"${stats['expenses']:,.2f}",
-            f"${stats['profit']:,.2f}",
-            f"{margin:.2f}%"
-        ])
-    
-    pdf.chapter_title('Monthly Performance Details')
-    pdf.add_table(month_table_headers, month_table_data)
-    
-    # Conclusion
+    if details_title is not None:
+        pdf.chapter_title(details_title)
+    pdf.add_table(*table)
+
+def _render_conclusion(pdf, best_product, worst_product, best_region, profit_margin):
+    """Render the conclusion and recommendations page"""
     pdf.add_page()
     pdf.chapter_title('Conclusion and Recommendations')
     
-    # Find best performing product
-    products = analysis_results['products']
-    best_product = max(products.items(), key=lambda x: x[1]['profit'])
-    worst_product = min(products.items(), key=lambda x: x[1]['profit'])
-    
-    # Find best performing region
-    regions = analysis_results['regions']
-    best_region = max(regions.items(), key=lambda x: x[1]['profit'])
-    
-    profit_margin = analysis_results['overall']['profit_margin']
-    
     conclusion = f"""
     Based on the analysis of the sales data:
     
-    1. The best performing product is {best_product[0]} with a profit of ${best_product[1]['profit']:,.2f}.
-    2. The product needing improvement is {worst_product[0]} with a profit of ${worst_product[1]['profit']:,.2f}.
-    3. The best performing region is {best_region[0]} with a profit of ${best_region[1]['profit']:,.2f}.
+    1. The best performing product is {best_product[0]} with a profit of ${best_product[1]:,.2f}.
+    2. The product needing improvement is {worst_product[0]} with a profit of ${worst_product[1]:,.2f}.
+    3. The best performing region is {best_region[0]} with a profit of ${best_region[1]:,.2f}.
     4. The overall profit margin is {profit_margin:.2f}%, which is {'good' if profit_margin > 20 else 'satisfactory' if profit_margin > 10 else 'needs improvement'}.
     
     Recommendations:
@@ -365,6 +425,30 @@ def generate_report(analysis_results, filename='sales_report.pdf'):
     """
     
     pdf.chapter_body(conclusion)
+
+def generate_report(analysis_results, charts, filename='sales_report.pdf'):
+    """Generate PDF report with analysis results"""
+    # Prepare all tables and findings before any page is rendered
+    products = analysis_results['products']
+    regions = analysis_results['regions']
+    product_table = format_table(products, 'Product')
+    region_table = format_table(regions, 'Region')
+    month_table = format_table(analysis_results['months'], 'Month')
+    
+    best_product = pick_group(products, np.argmax)
+    worst_product = pick_group(products, np.argmin)
+    best_region = pick_group(regions, np.argmax)
+    
+    # Render the pages in a single pass
+    pdf = PDFReport()
+    _render_summary(pdf, analysis_results['overall'])
+    _render_section(pdf, 'Product Performance', product_table,
+                    chart=charts['product'], details_title='Product Performance Details')
+    _render_section(pdf, 'Regional Performance', region_table)
+    _render_section(pdf, 'Monthly Trend Analysis', month_table,
+                    chart=charts['monthly'], details_title='Monthly Performance Details')
+    _render_conclusion(pdf, best_product, worst_product, best_region,
+                       analysis_results['overall']['profit_margin'])
     
     # Save the PDF
     pdf.output(filename)
@@ -381,7 +465,7 @@ def main():
     # Step 2: Read and analyze data
     print("Reading and analyzing data...")
     data = read_and_analyze_data(data_filename)
-    if not data:
+    if data is None or data.empty:
         print("Failed to read or analyze data. Exiting.")
         return
     
@@ -400,19 +484,17 @@ def main():
     
     # Step 4: Create visualizations
     print("Creating visualizations...")
-    create_charts(analysis_results)
+    charts = create_charts(analysis_results)
     
     # Step 5: Generate PDF report
     print("Generating PDF report...")
-    report_filename = generate_report(analysis_results)
+    report_filename = generate_report(analysis_results, charts)
     print(f"PDF report '{report_filename}' generated successfully!")
     
     # Step 6: Show where files are located
     print("\nGenerated Files:")
     print(f"1. Data file: {os.path.abspath(data_filename)}")
-    print(f"2. Product performance chart: {os.path.abspath('product_performance.png')}")
-    print(f"3. Monthly trend chart: {os.path.abspath('monthly_trend.png')}")
-    print(f"4. PDF report: {os.path.abspath(report_filename)}")
+    print(f"2. PDF report: {os.path.abspath(report_filename)}")
     
     print("\nReport generation completed successfully!")
 